@@ -0,0 +1,85 @@
+"""
+Git Blob Reader
+Reads file contents from git objects through one long-lived `git cat-file --batch` process.
+
+This module:
+- Starts a single `git cat-file --batch` worker on first use
+- Serves every blob lookup (e.g. "HEAD:data/tools.csv") over the same pipe
+- Closes the worker when the interpreter exits
+"""
+
+import atexit
+import subprocess
+from typing import Optional
+
+_process = None
+
+
+def _get_process():
+    """Return the running cat-file worker, starting it if needed."""
+    global _process
+    if _process is None or _process.poll() is not None:
+        _process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+    return _process
+
+
+def _read_exact(stream, size):
+    """Read exactly `size` bytes from an unbuffered stream."""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            raise EOFError("git cat-file closed its output unexpectedly")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_blob(ref: str) -> Optional[bytes]:
+    """
+    Read the contents of a blob from git.
+
+    Args:
+        ref: Object name understood by git, e.g. "HEAD:data/tools.csv"
+
+    Returns:
+        bytes: Blob contents, or None if the object does not exist
+    """
+    process = _get_process()
+    process.stdin.write(ref.encode("utf-8") + b"\n")
+
+    # Header is "<sha> <type> <size>" or "<ref> missing"
+    header = process.stdout.readline().split()
+    if len(header) != 3:
+        return None
+
+    size = int(header[2])
+    # Object contents are followed by a trailing newline
+    content = _read_exact(process.stdout, size + 1)[:size]
+
+    if header[1] != b"blob":
+        return None
+    return content
+
+
+def close():
+    """Stop the cat-file worker if it is running."""
+    global _process
+    if _process is None:
+        return
+    try:
+        _process.stdin.close()
+        _process.wait(timeout=5)
+    except Exception:
+        _process.kill()
+    _process = None
+
+
+atexit.register(close)
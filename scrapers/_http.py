@@ -0,0 +1,26 @@
+"""
+Shared HTTP Session
+One pooled `requests.Session` reused by every scraper.
+
+This module:
+- Keeps TCP/TLS connections alive between requests to the same host
+- Retries transient 5xx responses and connection errors with backoff
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# GraphQL queries are read-only, so POST is safe to retry as well
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    raise_on_status=False
+)
+
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=RETRY)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
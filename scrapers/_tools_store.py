@@ -0,0 +1,253 @@
+"""
+Tools Store Helpers
+Shared readers and writers for the tools database used by the scrapers and merge script.
+
+This module:
+- Stores tools in data/tools.parquet (canonical) and exports data/tools.csv
+- Stages newly scraped tools (deduplicated by URL) in data/pending_tools.csv until the merge
+- Parses and writes tools.csv with the PyArrow CSV reader/writer
+- Keeps every column as text so ids and dates round-trip unchanged
+- Loads only the url column when a caller just needs to deduplicate
+- Maintains a data/urls.txt index so dedup does not re-read the store
+"""
+
+import csv
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Column order used for every tools file
+TOOL_COLUMNS = ["id", "name", "description", "url", "category", "primary_category", "source", "launch_date"]
+
+
+def _column_names(source):
+    """Read the header row of a CSV path or binary stream."""
+    if isinstance(source, (str, Path)):
+        with open(source, newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), [])
+
+    position = source.tell()
+    first_line = source.readline()
+    source.seek(position)
+    return next(csv.reader([first_line.decode("utf-8")]), [])
+
+
+def _read_csv_table(source, convert_options):
+    """Parse a CSV path (memory-mapped) or binary stream into an Arrow table."""
+    read_options = pacsv.ReadOptions(use_threads=True)
+    if isinstance(source, (str, Path)):
+        # Parse straight from the page cache instead of copying the file into a buffer
+        with pa.memory_map(str(source), "r") as mapped:
+            return pacsv.read_csv(mapped, read_options=read_options, convert_options=convert_options)
+    return pacsv.read_csv(source, read_options=read_options, convert_options=convert_options)
+
+
+def read_tools_csv(source):
+    """
+    Load a tools CSV into a DataFrame.
+
+    Args:
+        source: Path to the CSV or a binary file-like object
+
+    Returns:
+        pandas.DataFrame: All columns as strings (missing values as None)
+    """
+    column_types = {name: pa.string() for name in _column_names(source)}
+    table = _read_csv_table(
+        source,
+        pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    )
+    return table.to_pandas()
+
+
+def read_tools_urls(source):
+    """
+    Load only the url column of a tools CSV.
+
+    Args:
+        source: Path to the CSV or a binary file-like object
+
+    Returns:
+        set: URLs present in the file
+    """
+    table = _read_csv_table(
+        source,
+        pacsv.ConvertOptions(
+            include_columns=["url"],
+            column_types={"url": pa.string()},
+            strings_can_be_null=True
+        )
+    )
+    return set(table.column("url").drop_null().to_pylist())
+
+
+def read_parquet_urls(source):
+    """
+    Load only the url column of a tools Parquet file.
+
+    Args:
+        source: Path to the Parquet file or a binary file-like object
+
+    Returns:
+        set: URLs present in the file
+    """
+    table = pq.read_table(source, columns=["url"], memory_map=True)
+    return set(table.column("url").drop_null().to_pylist())
+
+
+def read_tools(parquet_path, csv_path):
+    """
+    Load the tools database, preferring Parquet over the CSV export.
+
+    Args:
+        parquet_path: Path to tools.parquet
+        csv_path: Path to tools.csv (used when no Parquet file exists yet)
+
+    Returns:
+        pandas.DataFrame: Tools (empty if neither file exists)
+    """
+    if Path(parquet_path).exists():
+        return pq.read_table(parquet_path, memory_map=True).to_pandas()
+    if Path(csv_path).exists():
+        return read_tools_csv(csv_path)
+    return pd.DataFrame()
+
+
+def write_tools(df, parquet_path, csv_path=None):
+    """
+    Write the tools database to Parquet and optionally export it as CSV.
+
+    Args:
+        df: pandas.DataFrame of tools
+        parquet_path: Path to tools.parquet
+        csv_path: Path to tools.csv, or None to skip the CSV export
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, parquet_path, compression="zstd")
+    if csv_path is not None:
+        # Reuse the Arrow table - the C++ writer formats far faster than df.to_csv
+        pacsv.write_csv(table, csv_path, write_options=pacsv.WriteOptions(quoting_style="needed"))
+
+
+def append_pending_tools(pending_path, tools):
+    """
+    Append newly scraped tools to the pending CSV without rewriting it.
+
+    Args:
+        pending_path: Path to pending_tools.csv
+        tools: List of tool dictionaries
+    """
+    pending_path = Path(pending_path)
+    write_header = not pending_path.exists() or pending_path.stat().st_size == 0
+    with open(pending_path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=TOOL_COLUMNS, extrasaction="ignore")
+        if write_header:
+            writer.writeheader()
+        writer.writerows(tools)
+
+
+def primary_categories(categories):
+    """
+    Derive the primary category (first comma-separated entry) for each tool.
+
+    Args:
+        categories: pandas.Series of comma-separated category strings
+
+    Returns:
+        pandas.Series: First category of each row ("general" when missing)
+    """
+    values = pa.array(categories, from_pandas=True)
+    if not pa.types.is_string(values.type):
+        values = pc.cast(values, pa.string())
+    primary = pc.fill_null(pc.list_element(pc.split_pattern(values, ","), 0), "general")
+    return pd.Series(primary.to_numpy(zero_copy_only=False), index=categories.index)
+
+
+def url_index_path(store_path):
+    """Return the path of the urls.txt index that sits next to a tools file."""
+    return Path(store_path).parent / "urls.txt"
+
+
+def write_url_index(store_path, urls):
+    """Rewrite the urls.txt index for a tools file."""
+    with open(url_index_path(store_path), "w", encoding="utf-8") as f:
+        f.writelines(f"{url}\n" for url in urls)
+
+
+def append_url_index(store_path, urls):
+    """Append newly added URLs to the urls.txt index for a tools file."""
+    with open(url_index_path(store_path), "a", encoding="utf-8") as f:
+        f.writelines(f"{url}\n" for url in urls)
+
+
+def load_url_index(store_path):
+    """
+    Load the set of URLs in a tools file from its urls.txt index.
+
+    The index is rebuilt from the url column if it is missing or older
+    than the tools file (e.g. after a manual edit).
+
+    Args:
+        store_path: Path to tools.parquet or tools.csv
+
+    Returns:
+        set: URLs present in the tools file
+    """
+    store_path = Path(store_path)
+    index_path = url_index_path(store_path)
+    if not store_path.exists():
+        # Drop any index left over from a deleted tools file
+        index_path.unlink(missing_ok=True)
+        return set()
+
+    if index_path.exists() and index_path.stat().st_mtime >= store_path.stat().st_mtime:
+        return set(filter(None, index_path.read_text(encoding="utf-8").splitlines()))
+
+    if store_path.suffix == ".parquet":
+        urls = read_parquet_urls(store_path)
+    else:
+        urls = read_tools_urls(store_path)
+    write_url_index(store_path, urls)
+    return urls
+
+
+def stage_new_tools(tools, parquet_path, csv_path, pending_path):
+    """
+    Append scraped tools that are not in the database yet to the pending CSV.
+
+    Tools are checked against the urls.txt index of the store (and against
+    each other) and their URLs are added to the index, so later scrapers in
+    the same run skip them too. Tools without a URL are dropped.
+
+    Args:
+        tools: List of tool dictionaries
+        parquet_path: Path to tools.parquet
+        csv_path: Path to tools.csv (used for the index when no Parquet file exists yet)
+        pending_path: Path to pending_tools.csv
+
+    Returns:
+        list: The tools that were appended
+    """
+    parquet_path = Path(parquet_path)
+    try:
+        existing_urls = load_url_index(parquet_path if parquet_path.exists() else csv_path)
+    except Exception:
+        existing_urls = set()
+
+    new_tools = []
+    for tool in tools:
+        url = tool.get("url")
+        if not url or url in existing_urls:
+            continue
+        existing_urls.add(url)
+        new_tools.append(tool)
+
+    if new_tools:
+        # Append only the new rows (merge script will fold them into the database)
+        append_pending_tools(pending_path, new_tools)
+        append_url_index(parquet_path, [tool["url"] for tool in new_tools])
+    return new_tools
@@ -3,48 +3,72 @@ Alert and Commit Script
 Sends email alerts for new tools and commits changes to git.
 
 This script:
-- Checks if there are new tools (passed via environment or file)
+- Reads new tools from data/new_tools.json (written by merge_and_write.py)
 - Sends email via SMTP (Gmail) if new tools found
-- Commits updated tools.csv to git repository
+- Commits updated tools.parquet and tools.csv to git repository
 - Uses GitHub Actions secrets for email credentials
 """
 
 import os
-import sys
+import html
 import json
 import smtplib
 import subprocess
-from io import StringIO
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from pathlib import Path
 from datetime import datetime
-
-try:
-    import pandas as pd  # type: ignore
-except ImportError:  # pragma: no cover
-    pd = None
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from dataclasses import dataclass
+from typing import Optional
 
 # Paths
 DATA_DIR = Path(__file__).parent.parent / "data"
 TOOLS_CSV = DATA_DIR / "tools.csv"
+TOOLS_PARQUET = DATA_DIR / "tools.parquet"
+
+
+@dataclass(frozen=True)
+class Env:
+    """Email and GitHub settings, read from the environment once."""
+    smtp_user: Optional[str] = None
+    smtp_pass: Optional[str] = None
+    email_to: Optional[str] = None
+    github_actor: Optional[str] = None
+    github_token: Optional[str] = None
+    github_repository: Optional[str] = None
+
+    @classmethod
+    def from_environ(cls):
+        """Build settings from os.environ (GitHub Actions secrets/variables)."""
+        return cls(
+            smtp_user=os.getenv("SMTP_USER"),
+            smtp_pass=os.getenv("SMTP_PASS"),
+            email_to=os.getenv("EMAIL_TO"),
+            github_actor=os.getenv("GITHUB_ACTOR"),
+            github_token=os.getenv("GITHUB_TOKEN"),
+            github_repository=os.getenv("GITHUB_REPOSITORY"),
+        )
+
 
-def send_email_alert(new_tools):
+ENV = Env.from_environ()
+
+def send_email_alert(new_tools, env=ENV):
     """
     Send email alert with new tools.
     
+    EMAIL_TO may hold several comma-separated addresses; every recipient gets
+    their own message, all sent over a single SMTP session.
+    
     Args:
         new_tools: List of tool dictionaries
+        env: Env settings (defaults to the process environment)
     
     Returns:
         bool: True if email sent successfully
     """
-    smtp_user = os.getenv("SMTP_USER")
-    smtp_pass = os.getenv("SMTP_PASS")
-    email_to = os.getenv("EMAIL_TO")
+    smtp_user = env.smtp_user
+    smtp_pass = env.smtp_pass
+    email_to = env.email_to
     
     if not all([smtp_user, smtp_pass, email_to]):
         print("ℹ️ Email credentials not configured. Skipping email alert.")
@@ -55,15 +79,11 @@ def send_email_alert(new_tools):
         print("ℹ️ No new tools to alert about.")
         return False
     
+    recipients = [address.strip() for address in email_to.split(",") if address.strip()]
+    
     try:
-        # Create email
-        msg = MIMEMultipart()
-        msg["From"] = smtp_user
-        msg["To"] = email_to
-        msg["Subject"] = f"🤖 New AI Tools Discovered ({len(new_tools)} new tool(s))"
-        
-        # Email body
-        body = f"""
+        # Email body (fragments joined once; tool fields are HTML-escaped)
+        header = f"""
         <html>
         <body>
         <h2>New AI Tools Discovered!</h2>
@@ -71,23 +91,24 @@ def send_email_alert(new_tools):
         <ul>
         """
         
+        parts = []
         for tool in new_tools:
-            name = tool.get("name", "Unknown Tool")
-            url = tool.get("url", "#")
-            category = tool.get("category", "general")
-            description = tool.get("description", "No description")
-            launch_date = tool.get("launch_date", "Unknown date")
+            name = html.escape(str(tool.get("name") or "Unknown Tool"))
+            url = html.escape(str(tool.get("url") or "#"))
+            category = html.escape(str(tool.get("category") or "general"))
+            description = html.escape(str(tool.get("description") or "No description"))
+            launch_date = html.escape(str(tool.get("launch_date") or "Unknown date"))
             
-            body += f"""
+            parts.append(f"""
             <li>
                 <strong><a href="{url}">{name}</a></strong><br>
                 Category: {category}<br>
                 Description: {description}<br>
                 Launched: {launch_date}
             </li>
-            """
+            """)
         
-        body += """
+        footer = """
         </ul>
         <p>Check out your Streamlit app to see all tools!</p>
         <p><small>This is an automated email from your AI Tools Chatbot scraper.</small></p>
@@ -95,15 +116,27 @@ def send_email_alert(new_tools):
         </html>
         """
         
-        msg.attach(MIMEText(body, "html"))
+        body = header + "".join(parts) + footer
         
-        # Send email via Gmail SMTP
-        print(f"📧 Sending email to {email_to}...")
+        # Create one email per recipient
+        messages = []
+        for recipient in recipients:
+            msg = MIMEMultipart()
+            msg["From"] = smtp_user
+            msg["To"] = recipient
+            msg["Subject"] = f"🤖 New AI Tools Discovered ({len(new_tools)} new tool(s))"
+            msg.attach(MIMEText(body, "html"))
+            messages.append(msg)
+        
+        # Send email via Gmail SMTP (one TLS handshake and login for all messages)
+        print(f"📧 Sending email to {', '.join(recipients)}...")
         
         with smtplib.SMTP("smtp.gmail.com", 587) as server:
+            server.ehlo()
             server.starttls()
             server.login(smtp_user, smtp_pass)
-            server.send_message(msg)
+            for msg in messages:
+                server.send_message(msg)
         
         print("✅ Email sent successfully!")
         return True
@@ -113,18 +146,22 @@ def send_email_alert(new_tools):
         return False
 
 
-def commit_changes():
+def commit_changes(env=ENV):
     """
-    Commit updated tools.csv to git repository.
+    Commit updated tools.parquet and its tools.csv export to git repository.
+    
+    Args:
+        env: Env settings (defaults to the process environment)
     
     Returns:
         bool: True if commit successful
     """
     try:
-        # Check if we're in a git repository
+        # Check for changes (a non-zero exit also means we're not in a git repository)
         result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
+            ["git", "status", "--porcelain", str(TOOLS_CSV), str(TOOLS_PARQUET)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True
         )
         
@@ -132,40 +169,33 @@ def commit_changes():
             print("ℹ️ Not in a git repository. Skipping commit.")
             return False
         
-        # Check if there are changes
-        result = subprocess.run(
-            ["git", "status", "--porcelain", str(TOOLS_CSV)],
-            capture_output=True,
-            text=True
-        )
-        
         if not result.stdout.strip():
             print("ℹ️ No changes to commit.")
             return False
         
-        # Configure git (if in GitHub Actions)
-        github_actor = os.getenv("GITHUB_ACTOR")
+        # Pass the committer identity (if in GitHub Actions) to the commit itself
+        identity = []
+        github_actor = env.github_actor
         if github_actor:
-            subprocess.run(
-                ["git", "config", "user.name", github_actor],
-                check=False
-            )
-            subprocess.run(
-                ["git", "config", "user.email", f"{github_actor}@users.noreply.github.com"],
-                check=False
-            )
-        
-        # Add and commit
-        subprocess.run(["git", "add", str(TOOLS_CSV)], check=True)
+            identity = [
+                "-c", f"user.name={github_actor}",
+                "-c", f"user.email={github_actor}@users.noreply.github.com"
+            ]
+        
+        data_files = [str(path) for path in (TOOLS_CSV, TOOLS_PARQUET) if path.exists()]
+        
+        # Untracked files need an explicit add; tracked changes are committed by path
+        if any(line.startswith("??") for line in result.stdout.splitlines()):
+            subprocess.run(["git", "add", *data_files], check=True)
         
         commit_message = f"🤖 Update AI tools database - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        subprocess.run(["git", "commit", "-m", commit_message], check=True)
+        subprocess.run(["git", *identity, "commit", "-m", commit_message, "--", *data_files], check=True)
         
         # Push (if in GitHub Actions, GITHUB_TOKEN will be used)
-        github_token = os.getenv("GITHUB_TOKEN")
+        github_token = env.github_token
         if github_token:
             # Set up remote URL with token
-            repo = os.getenv("GITHUB_REPOSITORY")
+            repo = env.github_repository
             if repo:
                 remote_url = f"https://{github_token}@github.com/{repo}.git"
                 subprocess.run(["git", "remote", "set-url", "origin", remote_url], check=False)
@@ -183,12 +213,15 @@ def commit_changes():
         return False
 
 
-def main():
+def main(env=ENV):
     """
     Main function: Check for new tools, send email, commit changes.
+    
+    Args:
+        env: Env settings (defaults to the process environment)
     """
     
-    # Try to load new tools from JSON file (created by merge_and_write.py)
+    # Load new tools from JSON file (always written by merge_and_write.py)
     NEW_TOOLS_FILE = DATA_DIR / "new_tools.json"
     new_tools = []
     
@@ -200,39 +233,9 @@ def main():
         except Exception as e:
             print(f"⚠️ Error reading new_tools.json: {str(e)}")
     
-    # Fallback: Try to detect new tools by comparing to git
-    if pd is not None and not new_tools and TOOLS_CSV.exists():
-        try:
-            # Get current tools
-            current_df = pd.read_csv(TOOLS_CSV)
-            
-            # Try to get previous version from git
-            result = subprocess.run(
-                ["git", "show", "HEAD:data/tools.csv"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                previous_df = pd.read_csv(StringIO(result.stdout))
-                previous_urls = set(previous_df["url"].astype(str).tolist())
-                current_urls = set(current_df["url"].astype(str).tolist())
-                new_urls = current_urls - previous_urls
-                
-                if new_urls:
-                    new_tools_df = current_df[current_df["url"].astype(str).isin(new_urls)]
-                    new_tools = new_tools_df.to_dict("records")
-                    print(f"📧 Detected {len(new_tools)} new tools via git comparison")
-        except Exception:
-            # Git comparison failed, skip
-            pass
-    elif pd is None:
-        print("ℹ️ Pandas not installed. Skipping git comparison for new tools.")
-    
     # Send email if new tools found
     if new_tools:
-        send_email_alert(new_tools)
+        send_email_alert(new_tools, env)
         # Clean up JSON file after sending
         if NEW_TOOLS_FILE.exists():
             try:
@@ -243,7 +246,7 @@ def main():
         print("ℹ️ No new tools to alert about.")
     
     # Commit changes
-    commit_changes()
+    commit_changes(env)
 
 
 if __name__ == "__main__":
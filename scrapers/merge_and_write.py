@@ -1,136 +1,238 @@
 """
 Merge and Write Utility
-Merges scraped tools, deduplicates by URL, sorts by launch_date, and writes to CSV.
+Merges scraped tools, deduplicates by URL, sorts by launch_date, and writes to Parquet and CSV.
 
 This script:
-- Reads existing data/tools.csv
-- Merges with new tools from scrapers
+- Reads existing data/tools.parquet (or data/tools.csv)
+- Merges with new tools appended by scrapers to data/pending_tools.csv
 - Deduplicates by URL (keeps most recent)
 - Sorts by launch_date (newest first)
-- Writes back to data/tools.csv
-- Returns list of newly added tools for email alerts
+- Writes back to data/tools.parquet and exports data/tools.csv
+- Writes newly added tools to data/new_tools.json for email alerts
 """
 
 import sys
 import json
-import subprocess
-from io import StringIO
+from io import BytesIO
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from scrapers import _git_cat
+from scrapers._tools_store import (
+    TOOL_COLUMNS,
+    primary_categories,
+    read_parquet_urls,
+    read_tools,
+    read_tools_csv,
+    read_tools_urls,
+    write_tools,
+    write_url_index,
+)
+
 # Paths
 DATA_DIR = Path(__file__).parent.parent / "data"
-DATA_DIR.mkdir(exist_ok=True)
 TOOLS_CSV = DATA_DIR / "tools.csv"
+TOOLS_PARQUET = DATA_DIR / "tools.parquet"
+PENDING_CSV = DATA_DIR / "pending_tools.csv"
 SAMPLE_CSV = DATA_DIR / "sample_ai_tools.csv"
 
+def sort_by_launch_date(df):
+    """
+    Deduplicate by URL (keep most recent) and sort by launch_date (newest first).
+    
+    Args:
+        df: pandas.DataFrame of tools
+    
+    Returns:
+        pandas.DataFrame: Sorted tools with launch_date formatted as YYYY-MM-DD
+    """
+    df = df.drop_duplicates(subset=["url"], keep="last")
+    
+    if "launch_date" in df.columns:
+        # Parse the YYYY-MM-DD prefix of each ISO-8601 value once, in Arrow
+        raw_dates = pa.array(df["launch_date"], from_pandas=True)
+        if not pa.types.is_string(raw_dates.type):
+            raw_dates = pc.cast(raw_dates, pa.string())
+        dates = pc.strptime(
+            pc.utf8_slice_codeunits(raw_dates, 0, 10),
+            format="%Y-%m-%d",
+            unit="s",
+            error_is_null=True
+        )
+        order = pc.array_sort_indices(dates, order="descending", null_placement="at_end")
+        
+        df = df.iloc[order.to_numpy()].copy()
+        # Convert back to string for CSV
+        df["launch_date"] = pc.strftime(dates.take(order), format="%Y-%m-%d").to_numpy(zero_copy_only=False)
+    
+    return df
+
+
+def is_sorted_by_launch_date(df):
+    """Check that launch_date is newest first with missing dates at the end."""
+    dates = df["launch_date"]
+    missing = dates.isna().to_numpy()
+    valid_count = len(dates) - int(missing.sum())
+    return not missing[:valid_count].any() and dates.iloc[:valid_count].is_monotonic_decreasing
+
+
+def insert_sorted(existing_df, new_df):
+    """
+    Insert new tools into an already sorted, deduplicated set of tools.
+    
+    Only the new rows are sorted; each one is then placed with a binary search
+    over the existing YYYY-MM-DD launch dates, so the cost of a run no longer
+    grows with N log N of the whole database.
+    
+    Args:
+        existing_df: pandas.DataFrame sorted by launch_date (newest first)
+        new_df: pandas.DataFrame of tools whose URLs are not in existing_df
+    
+    Returns:
+        pandas.DataFrame: Combined tools, sorted by launch_date (newest first)
+    """
+    new_df = sort_by_launch_date(new_df)
+    
+    # Existing dates in ascending order (missing dates are kept at the end)
+    valid_dates = existing_df["launch_date"].dropna().to_numpy(dtype=object)[::-1]
+    new_dates = new_df["launch_date"].fillna("").to_numpy(dtype=object)
+    positions = np.where(
+        new_df["launch_date"].isna().to_numpy(),
+        len(existing_df),
+        len(valid_dates) - np.searchsorted(valid_dates, new_dates, side="left")
+    )
+    
+    order = np.insert(np.arange(len(existing_df)), positions, len(existing_df) + np.arange(len(new_df)))
+    return pd.concat([existing_df, new_df], ignore_index=True).iloc[order]
+
+
 def merge_and_write():
     """
-    Merge scraped tools, deduplicate, sort, and write to CSV.
+    Merge scraped tools, deduplicate, sort, and write to Parquet and CSV.
     
-    This function reads tools.csv (which may have been updated by scrapers),
-    compares it to the previous state, and returns new tools.
+    This function adds the rows staged in pending_tools.csv to tools.parquet,
+    compares the result to HEAD:data/tools.parquet, and returns new tools.
     
     Returns:
         list: List of newly added tool dictionaries
     """
-    # Load existing tools (before scrapers ran)
-    existing_df = pd.DataFrame()
-    existing_urls = set()
+    DATA_DIR.mkdir(exist_ok=True)
     
-    # Try to load previous state from a backup or check git diff
-    # For simplicity, we'll compare current tools.csv to what was there before
-    # In practice, scrapers append to tools.csv, so we need to track the baseline
+    # URLs of existing tools (before scrapers ran)
+    existing_urls = set()
     
-    # Load current tools.csv (after scrapers have run)
-    if TOOLS_CSV.exists():
-        try:
-            current_df = pd.read_csv(TOOLS_CSV)
-            print(f"📂 Loaded {len(current_df)} tools from {TOOLS_CSV}")
-        except Exception as e:
-            print(f"⚠️ Error reading tools.csv: {str(e)}")
-            current_df = pd.DataFrame()
-    else:
+    # Load the stored tools, falling back to tools.csv
+    try:
+        current_df = read_tools(TOOLS_PARQUET, TOOLS_CSV)
+        if not current_df.empty:
+            print(f"📂 Loaded {len(current_df)} tools")
+    except Exception as e:
+        print(f"⚠️ Error reading tools database: {str(e)}")
         current_df = pd.DataFrame()
     
-    # If tools.csv is empty or doesn't exist, initialize from sample
+    # If the database is empty or doesn't exist, initialize from sample
     if current_df.empty and SAMPLE_CSV.exists():
         try:
-            current_df = pd.read_csv(SAMPLE_CSV)
+            current_df = read_tools_csv(SAMPLE_CSV)
             print(f"📂 Initialized from sample CSV: {len(current_df)} tools")
         except Exception as e:
             print(f"⚠️ Error reading sample CSV: {str(e)}")
     
-    # For detecting new tools, we'll use a simple approach:
-    # Save a hash/set of URLs to a temp file, or use git to track changes
-    # For now, we'll write new tools to a temp file that alert script can read
+    # Add tools appended by the scrapers since the last merge
+    pending_ok = False
+    if PENDING_CSV.exists():
+        try:
+            pending_df = read_tools_csv(PENDING_CSV)
+            pending_ok = True
+            before = len(current_df)
+            # One hash-based pass drops pending rows whose URL is already stored
+            current_df = pd.concat([current_df, pending_df], ignore_index=True).drop_duplicates(
+                subset="url", keep="first", ignore_index=True
+            )
+            print(f"📂 Added {len(current_df) - before} pending tools from scrapers")
+        except Exception as e:
+            print(f"⚠️ Error reading pending_tools.csv: {str(e)}")
+    
+    # New tools are written to a JSON file that the alert script reads
     NEW_TOOLS_FILE = DATA_DIR / "new_tools.json"
     
     # Try to get baseline from git (if available)
     try:
-        # Get tools.csv from previous commit
-        result = subprocess.run(
-            ["git", "show", "HEAD:data/tools.csv"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            existing_df = pd.read_csv(StringIO(result.stdout))
-            existing_urls = set(existing_df["url"].astype(str).tolist())
-            print(f"📂 Found {len(existing_df)} tools in previous commit")
+        # Get tools from previous commit (Parquet, or CSV before it existed)
+        previous_blob = _git_cat.read_blob("HEAD:data/tools.parquet")
+        if previous_blob is not None:
+            existing_urls = read_parquet_urls(BytesIO(previous_blob))
+            print(f"📂 Found {len(existing_urls)} tools in previous commit")
+        else:
+            previous_blob = _git_cat.read_blob("HEAD:data/tools.csv")
+            if previous_blob is not None:
+                existing_urls = read_tools_urls(BytesIO(previous_blob))
+                print(f"📂 Found {len(existing_urls)} tools in previous commit")
     except:
         # No previous commit or not in git - assume all current tools are "existing"
-        existing_urls = set(current_df["url"].astype(str).tolist()) if not current_df.empty else set()
+        existing_urls = set(current_df["url"].dropna()) if not current_df.empty else set()
     
     # Find new tools (by URL)
+    new_urls = set()
     if not current_df.empty:
-        current_urls = set(current_df["url"].astype(str).tolist())
+        current_urls = set(current_df["url"].dropna())
         new_urls = current_urls - existing_urls
         
         if new_urls:
-            new_tools_df = current_df[current_df["url"].astype(str).isin(new_urls)]
-            new_tools_list = new_tools_df.to_dict("records")
+            new_tools_df = current_df[current_df["url"].isin(new_urls)]
+            # Missing values become null (JSON has no NaN); object dtype keeps the None
+            new_tools_list = new_tools_df.astype(object).where(new_tools_df.notna(), None).to_dict("records")
             print(f"✨ Found {len(new_tools_list)} new tools")
-            
-            # Save new tools to JSON file for alert script
-            try:
-                with open(NEW_TOOLS_FILE, "w") as f:
-                    json.dump(new_tools_list, f, indent=2)
-            except:
-                pass
         else:
             new_tools_list = []
             print("ℹ️ No new tools found")
-            # Clear new tools file
-            if NEW_TOOLS_FILE.exists():
-                NEW_TOOLS_FILE.unlink()
     else:
         new_tools_list = []
     
-    # Deduplicate by URL (keep most recent)
+    # Always write the JSON file (even if empty) - alert script reads only this
+    try:
+        with open(NEW_TOOLS_FILE, "w") as f:
+            json.dump(new_tools_list, f, indent=2)
+    except Exception as e:
+        print(f"⚠️ Error writing new_tools.json: {str(e)}")
+    
+    # Deduplicate by URL and sort by launch_date (newest first)
     if not current_df.empty:
-        current_df = current_df.drop_duplicates(subset=["url"], keep="last")
+        is_new = current_df["url"].isin(new_urls)
+        existing_df = current_df[~is_new]
         
-        # Sort by launch_date (newest first)
-        if "launch_date" in current_df.columns:
-            current_df["launch_date"] = pd.to_datetime(current_df["launch_date"], errors="coerce")
-            current_df = current_df.sort_values("launch_date", ascending=False, na_position="last")
-            # Convert back to string for CSV
-            current_df["launch_date"] = current_df["launch_date"].dt.strftime("%Y-%m-%d")
+        if "launch_date" in current_df.columns and is_sorted_by_launch_date(existing_df):
+            # The stored tools are already sorted - only place the new rows
+            current_df = insert_sorted(existing_df, current_df[is_new])
+        else:
+            current_df = sort_by_launch_date(current_df)
         
         # Ensure all required columns exist
-        required_cols = ["id", "name", "description", "url", "category", "primary_category", "source", "launch_date"]
-        for col in required_cols:
+        for col in TOOL_COLUMNS:
             if col not in current_df.columns:
                 current_df[col] = ""
         
-        # Write to CSV
-        current_df.to_csv(TOOLS_CSV, index=False)
-        print(f"💾 Saved {len(current_df)} tools to {TOOLS_CSV}")
+        # Fill in primary_category for rows that predate the column
+        missing_primary = current_df["primary_category"].isna() | (current_df["primary_category"] == "")
+        if missing_primary.any():
+            current_df.loc[missing_primary, "primary_category"] = primary_categories(
+                current_df.loc[missing_primary, "category"]
+            )
+        
+        # Write Parquet (canonical) and the CSV export
+        write_tools(current_df, TOOLS_PARQUET, TOOLS_CSV)
+        write_url_index(TOOLS_PARQUET, current_df["url"].dropna())
+        print(f"💾 Saved {len(current_df)} tools to {TOOLS_PARQUET} (CSV export: {TOOLS_CSV})")
+        
+        # Pending rows are now part of the database; keep an unreadable file for the next run
+        if pending_ok:
+            PENDING_CSV.unlink(missing_ok=True)
     
     return new_tools_list
 
@@ -0,0 +1,199 @@
+"""
+Product Hunt Client
+Shared GraphQL query and fetch helpers for the scraper and the Streamlit app.
+
+This module:
+- Holds the one Product Hunt posts query (page size, topic filter and cursor are variables)
+- Sends it over the pooled SESSION from scrapers/_http.py (token passed per request)
+- Streams posts with ijson when it is installed, otherwise decodes with orjson/json
+- Raises requests.HTTPError with the start of the body on non-200 responses
+- Maps each post's topics to our category string and primary category
+"""
+
+import requests
+
+from scrapers._http import SESSION
+
+# Try to import orjson for faster JSON decoding (optional)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+PH_API_URL = "https://api.producthunt.com/v2/api/graphql"
+
+# Note: Product Hunt API requires authentication and has rate limits.
+# id and the post url (fallback when website is missing) are only sent when
+# requested - the scraper stores them, the app never shows them.
+PH_QUERY = """
+query($first: Int!, $topic: String, $cursor: String, $topics: Int, $withId: Boolean = false, $withUrl: Boolean = false) {
+    posts(first: $first, order: VOTES, topic: $topic, after: $cursor) {
+        pageInfo {
+            endCursor
+            hasNextPage
+        }
+        edges {
+            node {
+                id @include(if: $withId)
+                name
+                tagline
+                url @include(if: $withUrl)
+                website
+                topics(first: $topics) {
+                    edges {
+                        node {
+                            name
+                        }
+                    }
+                }
+                createdAt
+            }
+        }
+    }
+}
+"""
+
+# Normalize common Product Hunt topic slugs to our category names
+CATEGORY_MAPPING = {
+    "fintech": "finance",
+    "developer-tools": "devtools",
+    "customer-support": "customer-support",
+    "content-marketing": "content",
+    "marketing": "marketing",
+    "productivity": "productivity",
+    "finance": "finance",
+    "ai": "ai",
+    "machine-learning": "ml",
+}
+
+
+def normalize_categories(node):
+    """
+    Turn a post's topics into our category string and primary category.
+    
+    Args:
+        node: Post node dictionary from the posts query
+    
+    Returns:
+        tuple: (comma-separated sorted categories, primary category), "general" when there are none
+    """
+    slugs = [t["node"]["name"].lower().replace(" ", "-") for t in node.get("topics", {}).get("edges", [])]
+    categories = sorted({CATEGORY_MAPPING.get(slug, slug) for slug in slugs})
+    if not categories:
+        return "general", "general"
+    return ",".join(categories), categories[0]
+
+
+def _post_query(api_key, variables, session, timeout, stream):
+    """Send PH_QUERY and return the response, raising on HTTP errors."""
+    response = (session or SESSION).post(
+        PH_API_URL,
+        json={"query": PH_QUERY, "variables": variables},
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=timeout,
+        stream=stream
+    )
+    if response.status_code != 200:
+        # Read just the start of the body instead of decoding all of it
+        snippet = next(response.iter_content(200), b"").decode("utf-8", "replace")
+        # Hand the (possibly streamed) connection back to the pool before raising
+        response.close()
+        raise requests.HTTPError(
+            f"Product Hunt API error {response.status_code}: {snippet}", response=response
+        )
+    return response
+
+
+def _decode_posts(content):
+    """Decode a full response body into the posts connection."""
+    data = json_loads(content)
+    if "errors" in data:
+        raise ValueError(f"GraphQL errors: {data['errors']}")
+    return (data.get("data") or {}).get("posts") or {}
+
+
+def fetch_posts(api_key, first=50, topic=None, session=None, timeout=30):
+    """
+    Fetch the top-voted Product Hunt posts, including their id and url.
+
+    Args:
+        api_key: Product Hunt API token
+        first: Number of posts to fetch
+        topic: Topic slug to filter by (e.g. "artificial-intelligence"), or None for all posts
+        session: requests.Session to use (defaults to the shared pooled session)
+        timeout: Request timeout in seconds
+
+    Returns:
+        list: Post node dictionaries
+    """
+    variables = {"first": first, "topic": topic, "withId": True, "withUrl": True}
+    response = _post_query(api_key, variables, session, timeout, stream=True)
+
+    try:
+        import ijson
+    except ImportError:
+        return [edge["node"] for edge in _decode_posts(response.content).get("edges", [])]
+
+    # Parse node by node as the body arrives; urllib3 undoes any gzip/deflate encoding
+    response.raw.decode_content = True
+    return _stream_posts(ijson, response.raw)
+
+
+def _stream_posts(ijson, stream):
+    """
+    Collect post nodes from a streamed body, raising on a GraphQL "errors" member.
+
+    Args:
+        ijson: The imported ijson module
+        stream: Binary file-like response body
+
+    Returns:
+        list: Post node dictionaries
+    """
+    # (prefix, start event) -> end event of the values we build
+    wanted = {("data.posts.edges.item.node", "start_map"): "end_map", ("errors", "start_array"): "end_array"}
+    nodes = []
+    errors = None
+    builder = None
+    for prefix, event, value in ijson.parse(stream):
+        if builder is None:
+            end = wanted.get((prefix, event))
+            if end is None:
+                continue
+            builder, start_prefix = ijson.ObjectBuilder(), prefix
+        builder.event(event, value)
+        if prefix == start_prefix and event == end:
+            if prefix == "errors":
+                errors = builder.value
+            else:
+                nodes.append(builder.value)
+            builder = None
+
+    if errors:
+        raise ValueError(f"GraphQL errors: {errors}")
+    return nodes
+
+
+def fetch_posts_page(api_key, first=15, topic=None, cursor=None, topics=3, session=None, timeout=10):
+    """
+    Fetch one page of top-voted Product Hunt posts for cursor pagination.
+
+    Args:
+        api_key: Product Hunt API token
+        first: Page size
+        topic: Topic slug to filter by, or None for all posts
+        cursor: endCursor of the previous page, or None for the first page
+        topics: Maximum number of topics per post
+        session: requests.Session to use (defaults to the shared pooled session)
+        timeout: Request timeout in seconds
+
+    Returns:
+        tuple: (list of post nodes, endCursor of this page or None on the last page)
+    """
+    variables = {"first": first, "topic": topic, "cursor": cursor, "topics": topics}
+    response = _post_query(api_key, variables, session, timeout, stream=False)
+
+    posts = _decode_posts(response.content)
+    page_info = posts.get("pageInfo") or {}
+    next_cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+    return [edge["node"] for edge in posts.get("edges", [])], next_cursor
@@ -0,0 +1,60 @@
+"""
+Scraper Runner
+Runs every source scraper at the same time and stages their results in one pass.
+
+This script:
+- Fetches Product Hunt and GitHub Trending concurrently (their requests overlap on the wire)
+- Shares the pooled HTTP session from scrapers/_http.py across all sources
+- Deduplicates the combined results against the urls.txt index once
+- Appends new tools to data/pending_tools.csv for merge_and_write.py
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers._tools_store import stage_new_tools
+from scrapers.scrape_github_trending import scrape_github_trending
+from scrapers.scrape_producthunt import scrape_producthunt
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / "data"
+OUTPUT_CSV = DATA_DIR / "tools.csv"
+OUTPUT_PARQUET = DATA_DIR / "tools.parquet"
+PENDING_CSV = DATA_DIR / "pending_tools.csv"
+
+# Every source scraper; each returns a list of tool dictionaries
+SCRAPERS = [scrape_producthunt, scrape_github_trending]
+
+
+def run_scrapers():
+    """
+    Run all scrapers concurrently.
+
+    The scrapers spend almost all their time waiting on the network, so
+    threads are enough to overlap them.
+
+    Returns:
+        list: Tool dictionaries from every source (in SCRAPERS order)
+    """
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as executor:
+        results = list(executor.map(lambda scraper: scraper(), SCRAPERS))
+    return [tool for tools in results for tool in tools]
+
+
+if __name__ == "__main__":
+    tools = run_scrapers()
+
+    if tools:
+        # Skip tools already in the database (checked against the urls.txt index)
+        new_tools = stage_new_tools(tools, OUTPUT_PARQUET, OUTPUT_CSV, PENDING_CSV)
+
+        if new_tools:
+            print(f"💾 Added {len(new_tools)} new tools to {PENDING_CSV}")
+        else:
+            print("ℹ️ All tools already exist in database")
+    else:
+        print("ℹ️ No new tools to save")
@@ -6,13 +6,13 @@ This script:
 - Fetches GitHub Trending page HTML
 - Extracts repository names, URLs, and descriptions
 - Filters for AI/ML related repos
-- Saves to data/tools.csv
+- Appends new tools to data/pending_tools.csv for merge_and_write.py
 - Uses respectful rate limiting and error handling
 """
 
 import os
+import re
 import sys
-import pandas as pd
 from pathlib import Path
 from datetime import datetime
 import time
@@ -20,10 +20,24 @@ import time
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from scrapers._tools_store import stage_new_tools
+
 # Paths
 DATA_DIR = Path(__file__).parent.parent / "data"
-DATA_DIR.mkdir(exist_ok=True)
 OUTPUT_CSV = DATA_DIR / "tools.csv"
+OUTPUT_PARQUET = DATA_DIR / "tools.parquet"
+PENDING_CSV = DATA_DIR / "pending_tools.csv"
+
+# AI/ML keywords to filter repositories
+AI_KEYWORDS = [
+    "ai", "artificial intelligence", "machine learning", "ml", "deep learning",
+    "neural", "nlp", "llm", "gpt", "transformer", "pytorch", "tensorflow",
+    "chatbot", "computer vision", "cv", "reinforcement learning", "openai"
+]
+
+# One compiled alternation scans the text once instead of once per keyword.
+# Anchored at word starts only, so plurals ("LLMs", "chatbots") still match.
+AI_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, AI_KEYWORDS)) + ")", re.IGNORECASE)
 
 def scrape_github_trending():
     """
@@ -32,19 +46,21 @@ def scrape_github_trending():
     Returns:
         list: List of tool dictionaries
     """
+    DATA_DIR.mkdir(exist_ok=True)
+    
     try:
-        import requests
+        from scrapers._http import SESSION
         from bs4 import BeautifulSoup
     except ImportError:
         print("⚠️ Required libraries not found. Install with: pip install requests beautifulsoup4")
         return []
     
-    # AI/ML keywords to filter repositories
-    ai_keywords = [
-        "ai", "artificial intelligence", "machine learning", "ml", "deep learning",
-        "neural", "nlp", "llm", "gpt", "transformer", "pytorch", "tensorflow",
-        "chatbot", "computer vision", "cv", "reinforcement learning"
-    ]
+    # Prefer the lxml (libxml2) parser; fall back to the pure-Python one
+    try:
+        from lxml import etree  # noqa: F401
+        html_parser = "lxml"
+    except ImportError:
+        html_parser = "html.parser"
     
     tools = []
     
@@ -59,28 +75,29 @@ def scrape_github_trending():
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, headers=headers, timeout=30)
         
         if response.status_code != 200:
             print(f"⚠️ GitHub Trending returned status {response.status_code}")
             return []
         
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Pass raw bytes so the parser decodes once using the page's charset
+        soup = BeautifulSoup(response.content, html_parser)
         
         # Find repository items (GitHub's HTML structure may change)
-        # Look for articles with class containing "Box-row"
-        repo_items = soup.find_all("article", class_=lambda x: x and "Box-row" in x)
+        # Look for articles with class "Box-row"
+        repo_items = soup.select("article.Box-row")
         
         if not repo_items:
             # Alternative: try finding by h2 tags with repo links
-            repo_items = soup.find_all("h2", class_=lambda x: x and "h3" in str(x))
+            repo_items = soup.select("h2.h3")
         
         print(f"📦 Found {len(repo_items)} repository items")
         
         for item in repo_items[:25]:  # Limit to top 25
             try:
                 # Extract repository name and URL
-                link_elem = item.find("a", href=True)
+                link_elem = item.select_one("a[href]")
                 if not link_elem:
                     continue
                 
@@ -88,18 +105,15 @@ def scrape_github_trending():
                 repo_name = repo_path.strip("/")
                 
                 # Extract description
-                desc_elem = item.find("p", class_=lambda x: x and "col-9" in str(x))
+                desc_elem = item.select_one("p.col-9")
                 if not desc_elem:
                     # Try alternative description location
-                    desc_elem = item.find("p")
+                    desc_elem = item.select_one("p")
                 
                 description = desc_elem.get_text(strip=True) if desc_elem else "No description"
                 
                 # Check if it's AI/ML related
-                name_lower = repo_name.lower()
-                desc_lower = description.lower()
-                
-                is_ai = any(keyword in name_lower or keyword in desc_lower for keyword in ai_keywords)
+                is_ai = bool(AI_RE.search(repo_name + " " + description))
                 
                 if is_ai:
                     repo_url = f"https://github.com{repo_path}"
@@ -136,44 +150,12 @@ if __name__ == "__main__":
     tools = scrape_github_trending()
     
     if tools:
-        # Load existing tools
-        existing_df = pd.DataFrame()
-        if OUTPUT_CSV.exists():
-            try:
-                existing_df = pd.read_csv(OUTPUT_CSV)
-                if not existing_df.empty and "primary_category" not in existing_df.columns:
-                    existing_df["primary_category"] = (
-                        existing_df["category"].astype(str).str.split(",").str[0].fillna("general")
-                    )
-            except:
-                pass
-        
-        # Create new DataFrame
-        new_df = pd.DataFrame(tools)
-        if not new_df.empty and "primary_category" not in new_df.columns:
-            new_df["primary_category"] = (
-                new_df["category"].astype(str).str.split(",").str[0].fillna("general")
-            )
+        # Skip tools already in the database (checked against the urls.txt index)
+        new_tools = stage_new_tools(tools, OUTPUT_PARQUET, OUTPUT_CSV, PENDING_CSV)
         
-        # Get existing URLs to avoid duplicates
-        existing_urls = set(existing_df["url"].astype(str).tolist()) if not existing_df.empty else set()
-        new_urls = set(new_df["url"].astype(str).tolist())
-        
-        # Filter out tools that already exist
-        new_tools_df = new_df[~new_df["url"].astype(str).isin(existing_urls)]
-        
-        if not new_tools_df.empty:
-            # Combine and save
-            if not existing_df.empty:
-                combined_df = pd.concat([existing_df, new_tools_df], ignore_index=True)
-            else:
-                combined_df = new_tools_df
-            
-            # Save (merge script will handle final deduplication and sorting)
-            combined_df.to_csv(OUTPUT_CSV, index=False)
-            print(f"💾 Added {len(new_tools_df)} new tools, total: {len(combined_df)}")
+        if new_tools:
+            print(f"💾 Added {len(new_tools)} new tools to {PENDING_CSV}")
         else:
             print("ℹ️ All tools already exist in database")
     else:
         print("ℹ️ No new tools to save")
-
@@ -3,7 +3,7 @@ AI Tools Chatbot - Streamlit Application
 A beginner-friendly chatbot that shows latest AI tools and provides category-specific recommendations.
 
 This app:
-- Fetches AI tools from Product Hunt API (if available) or CSV fallback
+- Fetches AI tools from Product Hunt API (if available) or the local tools.parquet/CSV fallback
 - Provides category-specific recommendations (finance, customer support, content, etc.)
 - Uses free Hugging Face models for summarization (with template fallback)
 - Displays tools with clickable URLs and launch dates
@@ -12,9 +12,12 @@ This app:
 import streamlit as st
 import pandas as pd
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 
+from scrapers.ph_client import fetch_posts_page, normalize_categories
+
 # Try to import transformers for AI summarization (optional)
 try:
     from transformers import pipeline
@@ -22,7 +25,17 @@ try:
 except Exception:
     TRANSFORMERS_AVAILABLE = False
 
+# Try to import ONNX Runtime via optimum for an int8 quantized model (optional)
+try:
+    from optimum.onnxruntime import ORTModelForCausalLM, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+    ORT_AVAILABLE = True
+except Exception:
+    ORT_AVAILABLE = False
+
 HF_MODEL_NAME = "distilgpt2"
+HF_INT8_DIR = Path("models") / "distilgpt2-int8"
 
 # Configure page
 st.set_page_config(
@@ -31,6 +44,61 @@ st.set_page_config(
     layout="wide"
 )
 
+
+@st.cache_resource(show_spinner=False)
+def _get_hf():
+    """
+    Return the Hugging Face text-generation pipeline.
+    
+    Cached per process so the model and tokenizer load once and are shared
+    by every browser session instead of being rebuilt for each visitor.
+    When optimum[onnxruntime] is installed the model is exported to ONNX and
+    dynamically quantized to int8 once (saved in HF_INT8_DIR); otherwise the
+    regular FP32 model is used.
+    """
+    if ORT_AVAILABLE:
+        try:
+            return _get_int8_pipeline()
+        except Exception as e:
+            print(f"⚠️ Int8 model unavailable, using {HF_MODEL_NAME}: {str(e)}")
+    
+    return pipeline(
+        "text-generation",
+        model=HF_MODEL_NAME,
+        max_new_tokens=80,
+        do_sample=False,
+        pad_token_id=50256,
+    )
+
+
+def _get_int8_pipeline():
+    """Build a text-generation pipeline on the int8 ONNX export of HF_MODEL_NAME."""
+    if not (HF_INT8_DIR / "model_quantized.onnx").exists():
+        # One-off export + dynamic int8 quantization (weights int8, activations float)
+        model = ORTModelForCausalLM.from_pretrained(
+            HF_MODEL_NAME, export=True, provider="CPUExecutionProvider"
+        )
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=HF_INT8_DIR,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+        )
+        AutoTokenizer.from_pretrained(HF_MODEL_NAME).save_pretrained(HF_INT8_DIR)
+    
+    ort_model = ORTModelForCausalLM.from_pretrained(
+        HF_INT8_DIR, file_name="model_quantized.onnx", provider="CPUExecutionProvider"
+    )
+    tokenizer = AutoTokenizer.from_pretrained(HF_INT8_DIR)
+    return pipeline(
+        "text-generation",
+        model=ort_model,
+        tokenizer=tokenizer,
+        max_new_tokens=80,
+        do_sample=False,
+        pad_token_id=50256,
+    )
+
+
 if not TRANSFORMERS_AVAILABLE:
     st.info(
         "Using the built-in summary template. Install the optional transformers package to enable AI-written summaries."
@@ -44,6 +112,25 @@ if "messages" not in st.session_state:
 DATA_DIR = Path("data")
 SAMPLE_CSV = DATA_DIR / "sample_ai_tools.csv"
 TOOLS_CSV = DATA_DIR / "tools.csv"
+TOOLS_PARQUET = DATA_DIR / "tools.parquet"
+
+# Upper bound on Product Hunt pages fetched per search (15 posts each)
+PH_MAX_PAGES = 10
+
+# Product Hunt topic slug the app's posts are filtered by
+PH_AI_TOPIC = "artificial-intelligence"
+
+# Tools summarized and rendered per answer; the rest are behind a "Show more" button
+MAX_DISPLAY = 20
+
+# Columns the app shows; the CSV fallback skips everything else
+DISPLAY_COLS = ["name", "description", "url", "category", "primary_category", "source", "launch_date"]
+
+# Columns searched by the filters
+TEXT_DTYPES = {"name": "string", "description": "string", "category": "string", "url": "string"}
+
+# Low-cardinality columns stored as pandas categoricals in the CSV fallback
+CATEGORY_DTYPES = {"category": "category", "source": "category"}
 
 SMALL_TALK_PATTERNS = [
     ("hello", "👋 Hi there! I'm your AI tools guide. Ask me about any category like finance, content, or customer support and I'll suggest helpful apps."),
@@ -57,6 +144,22 @@ SMALL_TALK_PATTERNS = [
     ("what can you do", "I keep an up-to-date list of AI tools and can suggest options by category like finance, marketing, or support."),
     ("help", "Need help? Try asking something like 'Show me finance tools' or 'Which tools help with content creation?'"),
 ]
+# Keywords used to detect the category a chat message is asking about
+CATEGORY_KEYWORDS = {
+    "finance": ["finance", "financial", "money", "banking", "investment"],
+    "customer-support": ["support", "customer", "service", "helpdesk", "chatbot"],
+    "content": ["content", "writing", "blog", "article", "copy"],
+    "devtools": ["development", "code", "programming", "developer", "api"],
+    "marketing": ["marketing", "social", "advertising", "campaign"],
+    "productivity": ["productivity", "task", "project", "management", "workflow"]
+}
+
+# One compiled alternation per category, matched at word starts (so plurals like "tasks" still match)
+CAT_PATTERNS = {
+    cat: re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + ")", re.I)
+    for cat, keywords in CATEGORY_KEYWORDS.items()
+}
+
 
 def get_small_talk_response(prompt_text):
     """Return a friendly response for greetings or general chat."""
@@ -66,176 +169,194 @@ def get_small_talk_response(prompt_text):
             return response
     return None
 
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_ph_raw(api_key, cursor=None):
+    """
+    Fetch one page of the latest Product Hunt posts as a DataFrame of AI tools.
+    
+    Cached for 10 minutes (per page cursor) so chat messages reuse one GraphQL
+    pull; filtering by category/query happens afterwards on the cached frame.
+    
+    Args:
+        api_key: Product Hunt API token
+        cursor: endCursor of the previous page, or None for the first page
+    
+    Returns:
+        tuple: (DataFrame of tools, endCursor of this page or None on the last page)
+    """
+    # One screenful of AI posts per page (topic filtered server-side, like the scraper);
+    # raises (rather than caching an empty result) on HTTP errors
+    nodes, next_cursor = fetch_posts_page(api_key, first=15, topic=PH_AI_TOPIC, cursor=cursor, topics=3)
+    
+    tools = []
+    
+    for node in nodes:
+        category_str, primary_category = normalize_categories(node)
+
+        tools.append({
+            "name": node.get("name", ""),
+            "description": node.get("tagline", ""),
+            "url": node.get("website", ""),
+            "category": category_str,
+            "primary_category": primary_category,
+            "source": "producthunt",
+            "launch_date": node.get("createdAt", "")
+        })
+
+    df = pd.DataFrame(tools)
+
+    if not df.empty:
+        df["category"] = df["category"].replace({None: "general"}).fillna("general")
+        if "primary_category" not in df.columns:
+            df["primary_category"] = (
+                df["category"].str.split(",").str[0].fillna("general")
+            )
+        df["source"] = df.get("source", "producthunt")
+        if "launch_date" in df.columns:
+            # One vectorized ISO-8601 parse (UTC so "Z" and naive stamps can mix)
+            df["launch_date"] = pd.to_datetime(df["launch_date"], errors="coerce", format="ISO8601", utc=True)
+            df = df.sort_values("launch_date", ascending=False, na_position="last")
+            df["launch_date"] = df["launch_date"].dt.strftime("%Y-%m-%d")
+
+    return df, next_cursor
+
+
+def _fetch_ph_pages(api_key):
+    """
+    Fetch every Product Hunt page loaded so far in this session.
+    
+    Pages are followed from the first one up to st.session_state["ph_cursor"]
+    (set by the "Load more" button); each page comes from the cache.
+    
+    Returns:
+        pandas.DataFrame: Tools from all loaded pages
+    """
+    target = st.session_state.get("ph_cursor")
+    frames = []
+    cursor = None
+    for _ in range(PH_MAX_PAGES):
+        df, next_cursor = _fetch_ph_raw(api_key, cursor)
+        frames.append(df)
+        if cursor == target or next_cursor is None:
+            break
+        cursor = next_cursor
+    
+    # Remembered for the next "Load more" click
+    st.session_state["ph_next_cursor"] = next_cursor
+    return pd.concat(frames, ignore_index=True)
+
+
+@st.cache_data(show_spinner=False)
+def _load_tools(path, mtime):
+    """
+    Load and normalize a tools Parquet or CSV file.
+    
+    The file's mtime is part of the cache key, so the file is only re-read
+    after the daily scraper (or a manual edit) changes it.
+    """
+    # Text columns stay on pandas' string dtype so the filters run vectorized
+    if path.suffix == ".parquet":
+        # Columnar load - no text parsing or type inference
+        df = pd.read_parquet(path, engine="pyarrow")
+        df = df.astype({col: dtype for col, dtype in TEXT_DTYPES.items() if col in df.columns})
+    else:
+        # Parse only the displayed columns; low-cardinality ones as categoricals
+        header = pd.read_csv(path, nrows=0).columns
+        df = pd.read_csv(
+            path,
+            engine="pyarrow",
+            usecols=[col for col in DISPLAY_COLS if col in header],
+            dtype={**TEXT_DTYPES, **CATEGORY_DTYPES}
+        )
+    
+    # Ensure required columns exist
+    required_cols = ["name", "description", "url", "category", "source", "launch_date"]
+    for col in required_cols:
+        if col not in df.columns:
+            df[col] = ""
+
+    if "primary_category" not in df.columns:
+        df["primary_category"] = (
+            df["category"].str.split(",").str[0].fillna("general")
+        )
+
+    if "launch_date" in df.columns:
+        # One vectorized ISO-8601 parse (UTC so "Z" and naive stamps can mix)
+        df["launch_date"] = pd.to_datetime(df["launch_date"], errors="coerce", format="ISO8601", utc=True)
+        df = df.sort_values("launch_date", ascending=False, na_position="last")
+        df["launch_date"] = df["launch_date"].dt.strftime("%Y-%m-%d")
+
+    return df
+
+
+def _filter_tools(df, category=None, q=None):
+    """Apply the category and search-query filters to a tools DataFrame."""
+    if df.empty:
+        return df
+    if category:
+        df = df[df["category"].astype("string").str.contains(category, case=False, regex=False, na=False)]
+    if q:
+        # The query is the raw chat message - match it literally against name + description
+        haystack = (
+            df["name"].fillna("").astype("string") + " \x1f " + df["description"].fillna("").astype("string")
+        )
+        df = df[haystack.str.contains(q, case=False, regex=False, na=False)]
+    return df
+
+
 def get_ai_tools(category=None, q=None):
     """
-    Fetch AI tools from Product Hunt API or CSV fallback.
+    Fetch AI tools from Product Hunt API or the local tools file fallback.
     
     Args:
         category: Filter by category (e.g., 'finance', 'customer-support', 'content')
         q: Search query string
     
     Returns:
-        pandas.DataFrame: DataFrame with columns: id, name, description, url, category, source, launch_date
+        pandas.DataFrame: DataFrame with columns: name, description, url, category, primary_category, source, launch_date
     """
     # Try Product Hunt API first (if API key is available)
     producthunt_api_key = os.getenv("PRODUCTHUNT_API_KEY")
     
     if producthunt_api_key:
         try:
-            # Product Hunt GraphQL endpoint
-            import requests
-            
-            query = """
-            query {
-                posts(first: 50, order: VOTES) {
-                    edges {
-                        node {
-                            id
-                            name
-                            tagline
-                            url
-                            website
-                            topics {
-                                edges {
-                                    node {
-                                        name
-                                    }
-                                }
-                            }
-                            createdAt
-                        }
-                    }
-                }
-            }
-            """
-            
-            headers = {
-                "Authorization": f"Bearer {producthunt_api_key}",
-                "Content-Type": "application/json"
-            }
+            df = _filter_tools(_fetch_ph_pages(producthunt_api_key), category, q)
             
-            response = requests.post(
-                "https://api.producthunt.com/v2/api/graphql",
-                json={"query": query},
-                headers=headers,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                tools = []
-                
-                for edge in data.get("data", {}).get("posts", {}).get("edges", []):
-                    node = edge["node"]
-                    topics = [t["node"]["name"] for t in node.get("topics", {}).get("edges", [])]
-                    category_slugs = [topic.lower().replace(" ", "-") for topic in topics]
-
-                    # Normalize common topic names
-                    category_mapping = {
-                        "fintech": "finance",
-                        "developer-tools": "devtools",
-                        "customer-support": "customer-support",
-                        "content-marketing": "content",
-                        "marketing": "marketing",
-                        "productivity": "productivity",
-                        "finance": "finance",
-                        "ai": "ai",
-                        "machine-learning": "ml",
-                    }
-                    normalized_categories = [category_mapping.get(slug, slug) for slug in category_slugs]
-                    normalized_categories = sorted(set(normalized_categories))
-                    category_str = ",".join(normalized_categories) if normalized_categories else "general"
-                    primary_category = normalized_categories[0] if normalized_categories else "general"
-
-                    tools.append({
-                        "id": node.get("id", ""),
-                        "name": node.get("name", ""),
-                        "description": node.get("tagline", ""),
-                        "url": node.get("website") or node.get("url", ""),
-                        "category": category_str,
-                        "primary_category": primary_category,
-                        "source": "producthunt",
-                        "launch_date": node.get("createdAt", "")
-                    })
-
-                df = pd.DataFrame(tools)
-
-                if not df.empty:
-                    df["category"] = df["category"].replace({None: "general"}).fillna("general")
-                    if "primary_category" not in df.columns:
-                        df["primary_category"] = (
-                            df["category"].astype(str).str.split(",").str[0].fillna("general")
-                        )
-                    df["source"] = df.get("source", "producthunt")
-                    if "launch_date" in df.columns:
-                        df["launch_date"] = pd.to_datetime(df["launch_date"], errors="coerce")
-                        df = df.sort_values("launch_date", ascending=False, na_position="last")
-                        df["launch_date"] = df["launch_date"].dt.strftime("%Y-%m-%d")
-
-                # Apply filters
-                if category:
-                    df = df[df["category"].str.contains(category, case=False, na=False)]
-                if q:
-                    df = df[
-                        df["name"].str.contains(q, case=False, na=False) |
-                        df["description"].str.contains(q, case=False, na=False)
-                    ]
-                
-                if not df.empty:
-                    return df
+            if not df.empty:
+                return df
         except Exception as e:
-            st.warning(f"⚠️ Product Hunt API error: {str(e)}. Falling back to CSV.")
+            st.warning(f"⚠️ Product Hunt API error: {str(e)}. Falling back to local data.")
     
-    # Fallback to CSV files
-    csv_path = TOOLS_CSV if TOOLS_CSV.exists() else SAMPLE_CSV
+    # Fallback to the local database (Parquet, then the CSV export, then the sample)
+    if TOOLS_PARQUET.exists():
+        data_path = TOOLS_PARQUET
+    else:
+        data_path = TOOLS_CSV if TOOLS_CSV.exists() else SAMPLE_CSV
     
-    if not csv_path.exists():
-        st.error(f"❌ Data file not found: {csv_path}")
+    if not data_path.exists():
+        st.error(f"❌ Data file not found: {data_path}")
         return pd.DataFrame()
     
     try:
-        df = pd.read_csv(csv_path)
-        
-        # Ensure required columns exist
-        required_cols = ["name", "description", "url", "category", "source", "launch_date"]
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ""
-
-        if "primary_category" not in df.columns:
-            df["primary_category"] = (
-                df["category"].astype(str).str.split(",").str[0].fillna("general")
-            )
-
-        # Apply filters
-        if category:
-            df = df[df["category"].astype(str).str.contains(category, case=False, na=False)]
-        if q:
-            df = df[
-                df["name"].str.contains(q, case=False, na=False) |
-                df["description"].str.contains(q, case=False, na=False)
-            ]
-
-        if "launch_date" in df.columns:
-            df["launch_date"] = pd.to_datetime(df["launch_date"], errors="coerce")
-            df = df.sort_values("launch_date", ascending=False, na_position="last")
-            df["launch_date"] = df["launch_date"].dt.strftime("%Y-%m-%d")
-
-        return df
+        df = _load_tools(data_path, data_path.stat().st_mtime)
+        return _filter_tools(df, category, q)
     except Exception as e:
-        st.error(f"❌ Error reading CSV: {str(e)}")
+        st.error(f"❌ Error reading {data_path.name}: {str(e)}")
         return pd.DataFrame()
 
 
-def summarize_tools(tools_list, user_question):
+def summarize_tools(tools_list, user_question, force_llm=False, total=None):
     """
     Generate a summary and recommendation for the tools list.
     
-    Uses Hugging Face transformers if available, otherwise falls back to template.
+    Uses the template for short lists and short questions; Hugging Face
+    transformers (if available) only runs for longer requests or when forced.
     
     Args:
         tools_list: List of tool dictionaries or DataFrame
         user_question: User's question/query
+        force_llm: Always use the model when transformers is available
+        total: Number of matching tools when tools_list is only the displayed part
     
     Returns:
         str: Summary text
@@ -246,19 +367,13 @@ def summarize_tools(tools_list, user_question):
     if not tools_list:
         return "No tools found matching your criteria."
     
-    # Try using transformers if available
-    if TRANSFORMERS_AVAILABLE:
+    # Generation takes seconds on CPU - only worth it for long lists and detailed questions
+    use_llm = TRANSFORMERS_AVAILABLE and (
+        force_llm or (len(tools_list) >= 6 and bool(user_question) and len(user_question) > 40)
+    )
+    if use_llm:
         try:
-            generator = st.session_state.get("hf_generator")
-            if generator is None:
-                generator = pipeline(
-                    "text-generation",
-                    model=HF_MODEL_NAME,
-                    max_new_tokens=80,
-                    do_sample=False,
-                    pad_token_id=50256,
-                )
-                st.session_state["hf_generator"] = generator
+            generator = _get_hf()
 
             prompt_text = (
                 "Summarize the following AI tools in two short sentences and recommend the best fit for the user's request.\n"
@@ -292,7 +407,7 @@ def summarize_tools(tools_list, user_question):
             pass
     
     # Template-based fallback (always works)
-    num_tools = len(tools_list)
+    num_tools = total or len(tools_list)
     categories = []
     for tool in tools_list:
         category_field = tool.get("category", "general")
@@ -317,60 +432,66 @@ def summarize_tools(tools_list, user_question):
     return summary.strip()
 
 
-def render_tools_list(df):
+def render_tools_list(df, total=None):
     """
     Display tools in a nice format with clickable URLs.
     
+    The markdown for every tool is built with vectorized string operations
+    and sent to the page in a single st.markdown call.
+    
     Args:
         df: pandas.DataFrame with tool data
+        total: Number of matching tools when df is only the displayed part
     """
     if df.empty:
         st.info("No tools found. Try a different category or search term.")
         return
     
-    st.subheader(f"📊 Found {len(df)} tool(s)")
+    total = total or len(df)
+    if total > len(df):
+        st.subheader(f"📊 Found {total} tool(s) - showing {len(df)} of {total}")
+    else:
+        st.subheader(f"📊 Found {total} tool(s)")
     
-    # Display tools in columns
-    for idx, row in df.iterrows():
-        with st.container():
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"### {row.get('name', 'Unknown Tool')}")
-                st.markdown(f"**Description:** {row.get('description', 'No description available')}")
-                
-                # Category badge
-                category_field = row.get('category', 'general') or 'general'
-                category_list = [c.strip() for c in str(category_field).replace(';', ',').split(',') if c.strip()]
-                primary_category = row.get('primary_category') or (category_list[0] if category_list else 'general')
-                st.markdown(f"**Primary category:** `{primary_category}`")
-                if len(category_list) > 1:
-                    st.markdown("**Other tags:** " + ", ".join(f"`{c}`" for c in category_list[1:]))
-                
-                # Launch date
-                launch_date = row.get('launch_date', '')
-                if launch_date:
-                    try:
-                        # Try to format date
-                        if isinstance(launch_date, str):
-                            date_obj = pd.to_datetime(launch_date, errors='coerce')
-                            if pd.notna(date_obj):
-                                formatted_date = date_obj.strftime("%Y-%m-%d")
-                                st.markdown(f"**Launched:** {formatted_date}")
-                    except:
-                        st.markdown(f"**Launched:** {launch_date}")
-            
-            with col2:
-                url = row.get('url', '')
-                if url:
-                    st.markdown(f"[🔗 Visit Tool]({url})")
-                else:
-                    st.markdown("🔗 No URL available")
-                
-                source = row.get('source', 'unknown')
-                st.markdown(f"**Source:** `{source}`")
-            
-            st.divider()
+    def text(column, default):
+        if column not in df.columns:
+            return pd.Series(default, index=df.index)
+        return df[column].astype("string").fillna(default).replace("", default)
+    
+    # Category badge: first entry is the primary category, the rest are tags
+    categories = (
+        text("category", "general")
+        .str.replace(r"\s*[,;]\s*", ",", regex=True)
+        .str.replace(r",{2,}", ",", regex=True)
+        .str.strip(", ")
+        .str.split(",", n=1)
+    )
+    primary = text("primary_category", "").where(lambda p: p != "", categories.str[0]).replace("", "general")
+    other_tags = categories.str[1].fillna("")
+    tags_md = ("**Other tags:** `" + other_tags.str.replace(",", "`, `") + "`\n\n").where(other_tags != "", "")
+    
+    # Launch dates were already parsed and formatted as YYYY-MM-DD when the data was loaded
+    launched = text("launch_date", "")
+    launched_md = ("**Launched:** " + launched + "\n\n").where(launched != "", "")
+    
+    url = text("url", "")
+    url_md = ("[🔗 Visit Tool](" + url + ")").where(url != "", "🔗 No URL available")
+    
+    parts = (
+        "### " + text("name", "Unknown Tool") + "\n\n"
+        + "**Description:** " + text("description", "No description available") + "\n\n"
+        + "**Primary category:** `" + primary + "`\n\n"
+        + tags_md
+        + launched_md
+        + url_md + " · **Source:** `" + text("source", "unknown") + "`\n\n"
+        + "---\n\n"
+    )
+    st.markdown("".join(parts.tolist()))
+
+
+def _set_show_all(value):
+    """Callback: expand ("Show N more") or collapse (new question) the last result list."""
+    st.session_state["show_all"] = value
 
 
 # Main UI
@@ -389,6 +510,29 @@ with st.sidebar:
     selected_category = st.selectbox("Filter by Category", categories)
     category_filter = None if selected_category == "all" else selected_category
     
+    # Template summaries are instant; the model is opt-in
+    use_llm_summaries = st.checkbox(
+        "Use LLM summaries",
+        value=False,
+        disabled=not TRANSFORMERS_AVAILABLE,
+        help="Summarize results with the Hugging Face model instead of the template"
+    )
+    
+    # Product Hunt pagination (only used when an API key is configured)
+    producthunt_api_key = os.getenv("PRODUCTHUNT_API_KEY")
+    if producthunt_api_key and st.button("⬇️ Load more Product Hunt posts"):
+        try:
+            if "ph_next_cursor" not in st.session_state:
+                _fetch_ph_pages(producthunt_api_key)
+            if st.session_state["ph_next_cursor"] is None:
+                st.info("No more Product Hunt posts to load.")
+            else:
+                st.session_state["ph_cursor"] = st.session_state["ph_next_cursor"]
+                _fetch_ph_pages(producthunt_api_key)
+                st.success("Loaded another page - ask again to search it.")
+        except Exception as e:
+            st.warning(f"⚠️ Product Hunt API error: {str(e)}")
+    
     # Enable alerts section
     st.divider()
     st.subheader("📧 Email Alerts")
@@ -418,8 +562,17 @@ for message in st.session_state.messages:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
 
+# Full result list after "Show N more" was clicked
+if st.session_state.get("show_all") and st.session_state.get("last_tools") is not None:
+    with st.chat_message("assistant"):
+        render_tools_list(st.session_state["last_tools"])
+
 # Chat input
-if prompt := st.chat_input("Ask about AI tools (e.g., 'Show me finance tools' or 'What tools help with content creation?')"):
+if prompt := st.chat_input(
+    "Ask about AI tools (e.g., 'Show me finance tools' or 'What tools help with content creation?')",
+    on_submit=_set_show_all,
+    args=(False,)
+):
     # Add user message to history
     st.session_state.messages.append({"role": "user", "content": prompt})
     
@@ -432,21 +585,9 @@ if prompt := st.chat_input("Ask about AI tools (e.g., 'Show me finance tools' or
     with st.chat_message("assistant"):
         with st.spinner("Searching for AI tools..."):
             # Extract category from prompt (simple keyword matching)
-            detected_category = None
-            category_keywords = {
-                "finance": ["finance", "financial", "money", "banking", "investment"],
-                "customer-support": ["support", "customer", "service", "helpdesk", "chatbot"],
-                "content": ["content", "writing", "blog", "article", "copy"],
-                "devtools": ["development", "code", "programming", "developer", "api"],
-                "marketing": ["marketing", "social", "advertising", "campaign"],
-                "productivity": ["productivity", "task", "project", "management", "workflow"]
-            }
+            detected_category = next((cat for cat, pattern in CAT_PATTERNS.items() if pattern.search(prompt)), None)
             
             prompt_lower = prompt.lower()
-            for cat, keywords in category_keywords.items():
-                if any(keyword in prompt_lower for keyword in keywords):
-                    detected_category = cat
-                    break
             
             # Use detected category or sidebar filter
             search_category = detected_category or category_filter
@@ -459,16 +600,25 @@ if prompt := st.chat_input("Ask about AI tools (e.g., 'Show me finance tools' or
             # Search for tools
             tools_df = get_ai_tools(category=search_category, q=search_query)
             
+            st.session_state["last_tools"] = tools_df
+            
             if not tools_df.empty:
+                # Summarize and render a bounded view; the rest loads on demand
+                view = tools_df.head(MAX_DISPLAY)
+                
                 # Generate summary
-                summary = summarize_tools(tools_df, prompt)
+                summary = summarize_tools(view, prompt, force_llm=use_llm_summaries, total=len(tools_df))
                 assistant_reply = summary
                 st.markdown(summary)
                 
                 st.markdown("---")
                 
                 # Display tools
-                render_tools_list(tools_df)
+                render_tools_list(view, total=len(tools_df))
+                
+                hidden = len(tools_df) - len(view)
+                if hidden > 0:
+                    st.button(f"Show {hidden} more", on_click=_set_show_all, args=(True,))
             else:
                 small_talk = get_small_talk_response(prompt)
                 if small_talk: